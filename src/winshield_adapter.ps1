@@ -4,6 +4,7 @@
 
 .DESCRIPTION
     Aggregates MSRC CVRF data for a specific Windows product across one or more MonthIds.
+    Emits one KB entry per KB and month, so results can be cached per month.
     Emits a JSON object consumed by winshield_scanner.py.
 #>
 
@@ -49,6 +50,53 @@ try {
     exit 1
 }
 
+# ------------------------------------------------------------
+# PARALLEL CVRF RETRIEVAL
+# ------------------------------------------------------------
+
+$fetchMonth = {
+    param([string]$MonthId)
+
+    try {
+        Import-Module MsrcSecurityUpdates -ErrorAction Stop
+
+        $doc = Get-MsrcCvrfDocument -ID $MonthId -ErrorAction Stop
+        Get-MsrcCvrfAffectedSoftware `
+            -Vulnerability $doc.Vulnerability `
+            -ProductTree $doc.ProductTree
+    } catch {
+    }
+}
+
+$pool = [runspacefactory]::CreateRunspacePool(1, [Math]::Min(6, $MonthIds.Count))
+$pool.Open()
+
+$jobs = foreach ($month in $MonthIds) {
+    $shell = [powershell]::Create()
+    $shell.RunspacePool = $pool
+    [void]$shell.AddScript($fetchMonth).AddArgument($month)
+
+    [pscustomobject]@{
+        Month  = $month
+        Shell  = $shell
+        Handle = $shell.BeginInvoke()
+    }
+}
+
+$affectedByMonth = @{}
+
+foreach ($job in $jobs) {
+    try {
+        $affectedByMonth[$job.Month] = @($job.Shell.EndInvoke($job.Handle))
+    } catch {
+    } finally {
+        $job.Shell.Dispose()
+    }
+}
+
+$pool.Close()
+$pool.Dispose()
+
 # ------------------------------------------------------------
 # AGGREGATION CONTAINER
 # ------------------------------------------------------------
@@ -61,15 +109,7 @@ $kbMap = @{}
 
 foreach ($month in $MonthIds) {
 
-    try {
-        $doc = Get-MsrcCvrfDocument -ID $month -ErrorAction Stop
-        $aff = Get-MsrcCvrfAffectedSoftware `
-            -Vulnerability $doc.Vulnerability `
-            -ProductTree $doc.ProductTree
-    } catch {
-        continue
-    }
-
+    $aff = $affectedByMonth[$month]
     if (-not $aff) { continue }
 
     $rows = $aff | Where-Object { $_.FullProductName -eq $ProductNameHint }
@@ -101,28 +141,26 @@ foreach ($month in $MonthIds) {
                 "KB$($kbObj.ID)"
             }
 
-            if (-not $kbMap.ContainsKey($kb)) {
-                $kbMap[$kb] = [pscustomobject]@{
+            $key = "$month|$kb"
+
+            if (-not $kbMap.ContainsKey($key)) {
+                $kbMap[$key] = [pscustomobject]@{
                     KB         = $kb
-                    Months     = @()
+                    Months     = @($month)
                     Cves       = @()
                     Supersedes = @()
                 }
             }
 
-            if ($kbMap[$kb].Months -notcontains $month) {
-                $kbMap[$kb].Months += $month
-            }
-
             foreach ($c in $cveList) {
-                if ($c -and $kbMap[$kb].Cves -notcontains $c) {
-                    $kbMap[$kb].Cves += $c
+                if ($c -and $kbMap[$key].Cves -notcontains $c) {
+                    $kbMap[$key].Cves += $c
                 }
             }
 
             foreach ($s in $supersedes) {
-                if ($s -and $kbMap[$kb].Supersedes -notcontains $s) {
-                    $kbMap[$kb].Supersedes += $s
+                if ($s -and $kbMap[$key].Supersedes -notcontains $s) {
+                    $kbMap[$key].Supersedes += $s
                 }
             }
         }
@@ -139,6 +177,6 @@ foreach ($month in $MonthIds) {
     KbEntries       = @(
         $kbMap.GetEnumerator() |
             ForEach-Object { $_.Value } |
-            Sort-Object KB
+            Sort-Object KB, { $_.Months[0] }
     )
 } | ConvertTo-Json -Depth 10
@@ -5,14 +5,26 @@ Resolves and downloads a selected missing Windows update package
 from the Microsoft Update Catalog based on baseline constraints.
 """
 
+import codecs
 import json
 import os
 import re
-from dataclasses import dataclass
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -21,10 +33,13 @@ ROOT_DIR = os.path.dirname(SCRIPT_DIR)
 RESULTS_DIR = os.path.join(ROOT_DIR, "results")
 DOWNLOADS_DIR = os.path.join(ROOT_DIR, "downloads")
 
+CATALOG_CACHE_DIR = os.path.join(RESULTS_DIR, "catalog_cache")
+
 SCAN_RESULT_PATH = os.path.join(RESULTS_DIR, "winshield_scan_result.json")
 
 os.makedirs(RESULTS_DIR, exist_ok=True)
 os.makedirs(DOWNLOADS_DIR, exist_ok=True)
+os.makedirs(CATALOG_CACHE_DIR, exist_ok=True)
 
 
 CATALOG_BASE = "https://www.catalog.update.microsoft.com"
@@ -32,6 +47,76 @@ SEARCH_URL = f"{CATALOG_BASE}/Search.aspx"
 DOWNLOAD_DIALOG_URL = f"{CATALOG_BASE}/DownloadDialog.aspx"
 
 DEFAULT_TIMEOUT = 30
+CATALOG_CACHE_TTL = 3600
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+MAX_DOWNLOAD_WORKERS = 4
+
+DIALOG_CHUNK_SIZE = 8192
+DIALOG_SCAN_OVERLAP = 4096
+DIALOG_MAX_BYTES = 1024 * 1024
+
+RESULTS_TABLE_ID = "ctl00_catalogBody_updateMatches"
+
+_ROW_XPATH = etree.XPath(
+    "//table[@id=$tid]//tr[contains(@id,'_R') and string-length(substring-before(@id,'_R'))=36]"
+)
+_TD_XPATH = etree.XPath("./td")
+
+_parser_local = threading.local()
+
+_CACHE_NAME_RE = re.compile(r"[^A-Za-z0-9_-]")
+_UUID_RE = re.compile(r"[0-9a-fA-F-]{36}")
+_HV_RE = re.compile(r"\b\d{2}h[12]\b")
+_BUILD_RE = re.compile(r"\(\s*(\d{5})\.")
+_DOWNLOAD_URL_RE = re.compile(
+    r'href="(https?://[^"]+\.(?:msu|cab)(?:\?[^"]*)?)"'
+    r"|\.url\s*=\s*'(https?://[^']+\.(?:msu|cab)(?:\?[^']*)?)'",
+    re.IGNORECASE,
+)
+
+_EMPTY_ENTRY: dict = {}
+
+_WINDOWS_GENS: Tuple[str, ...] = ("windows 11", "windows 10")
+
+_ARCH_MAP: Dict[str, str] = {
+    "x64": "x64",
+    "amd64": "x64",
+    "arm64": "arm64",
+    "x86": "x86",
+    "32-bit": "x86",
+}
+
+_KW_WIN10 = 1 << 0
+_KW_WIN11 = 1 << 1
+_KW_SERVER = 1 << 2
+_KW_ARM64 = 1 << 3
+_KW_X64 = 1 << 4
+_KW_X86 = 1 << 5
+_KW_32BIT = 1 << 6
+
+_KEYWORD_BITS: Dict[str, int] = {
+    "windows 10": _KW_WIN10,
+    "windows 11": _KW_WIN11,
+    "server": _KW_SERVER,
+    "arm64-based": _KW_ARM64,
+    "x64-based": _KW_X64,
+    "x86-based": _KW_X86,
+    "32-bit": _KW_32BIT,
+}
+_KEYWORD_RE = re.compile("|".join(map(re.escape, _KEYWORD_BITS)))
+
+# windows_gen -> (matching bit, conflicting bit)
+_GEN_BITS: Dict[str, Tuple[int, int]] = {
+    "windows 10": (_KW_WIN10, _KW_WIN11),
+    "windows 11": (_KW_WIN11, _KW_WIN10),
+}
+
+# catalog_arch -> (veto bits, bonus bits)
+_ARCH_RULES: Dict[str, Tuple[int, int]] = {
+    "x64": (_KW_ARM64 | _KW_X86 | _KW_32BIT, _KW_X64),
+    "arm64": (_KW_X64 | _KW_X86 | _KW_32BIT, _KW_ARM64),
+    "x86": (_KW_X64 | _KW_ARM64, _KW_X86 | _KW_32BIT),
+}
 
 
 @dataclass(frozen=True)
@@ -49,6 +134,20 @@ class CatalogCandidate:
     last_updated: str
     version: str
     size: str
+    title_folded: str = field(init=False, repr=False, compare=False)
+    keyword_mask: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        title_folded = self.title.casefold()
+        object.__setattr__(self, "title_folded", title_folded)
+        object.__setattr__(self, "keyword_mask", _keyword_mask(title_folded))
+
+
+@dataclass(frozen=True)
+class DownloadOutcome:
+    kb_id: str
+    out_path: Optional[str] = None
+    error: Optional[str] = None
 
 
 @dataclass(frozen=True)
@@ -64,8 +163,10 @@ def load_scan_result(path: str) -> dict:
     if not os.path.isfile(path):
         raise RuntimeError("Scan result not found. Run winshield_scanner.py first.")
 
-    with open(path, "r", encoding="utf-8") as handle:
-        return json.load(handle)
+    with open(path, "rb") as handle:
+        raw = handle.read()
+
+    return orjson.loads(raw) if orjson else json.loads(raw)
 
 
 def safe_input(prompt: str) -> str:
@@ -79,28 +180,14 @@ def safe_input(prompt: str) -> str:
 def build_constraints(baseline: dict) -> BaselineConstraints:
     """Derive catalog matching constraints from baseline metadata."""
 
-    os_name = str(baseline.get("OsName") or "").lower()
-    display_version = str(baseline.get("DisplayVersion") or "").strip()
-    arch = str(baseline.get("Architecture") or "").lower()
-    build = str(baseline.get("Build") or "")
+    os_name = str(baseline.get("OsName") or "").casefold()
+    display_version = str(baseline.get("DisplayVersion") or "").strip().casefold()
+    arch = str(baseline.get("Architecture") or "").strip().casefold()
+    build = str(baseline.get("Build") or "").strip()
 
     build_major = build.split(".", 1)[0] if build else ""
-
-    if "windows 11" in os_name:
-        windows_gen = "windows 11"
-    elif "windows 10" in os_name:
-        windows_gen = "windows 10"
-    else:
-        windows_gen = ""
-
-    if arch in ("x64", "amd64"):
-        catalog_arch = "x64"
-    elif "arm64" in arch:
-        catalog_arch = "arm64"
-    elif arch in ("x86", "32-bit"):
-        catalog_arch = "x86"
-    else:
-        catalog_arch = "x64"
+    windows_gen = next((gen for gen in _WINDOWS_GENS if gen in os_name), "")
+    catalog_arch = _ARCH_MAP.get(arch, "x64")
 
     return BaselineConstraints(
         windows_gen=windows_gen,
@@ -111,22 +198,72 @@ def build_constraints(baseline: dict) -> BaselineConstraints:
 
 
 def build_session() -> requests.Session:
-    """Create an HTTP session with stable headers."""
+    """Create an HTTP session with stable headers and pooled, retrying connections."""
     s = requests.Session()
     s.headers.update(
         {
             "User-Agent": "winshield-downloader",
             "Accept-Language": "en-GB,en;q=0.9",
+            "Accept-Encoding": "gzip, deflate",
         }
     )
+
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+    )
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+
     return s
 
 
-def fetch_text(session: requests.Session, url: str, params: dict | None = None) -> str:
-    """Fetch HTML content and raise on HTTP errors."""
+def fetch_html(session: requests.Session, url: str, params: dict | None = None) -> bytes:
+    """Fetch HTML content as UTF-8 bytes and raise on HTTP errors."""
     r = session.get(url, params=params, timeout=DEFAULT_TIMEOUT)
     r.raise_for_status()
-    return r.text
+
+    try:
+        if codecs.lookup(r.encoding or "utf-8").name == "utf-8":
+            return r.content
+    except LookupError:
+        pass
+
+    return r.text.encode("utf-8")
+
+
+def search_cache_path(kb_id: str) -> str:
+    """Return the cache file path for a KB's catalog search page."""
+    return os.path.join(CATALOG_CACHE_DIR, _CACHE_NAME_RE.sub("_", kb_id.upper()) + ".html")
+
+
+def load_cached_search(kb_id: str) -> Optional[bytes]:
+    """Return a cached catalog search page for a KB, or None when absent or expired."""
+
+    path = search_cache_path(kb_id)
+
+    try:
+        if time.time() - os.path.getmtime(path) >= CATALOG_CACHE_TTL:
+            return None
+        with open(path, "rb") as handle:
+            return handle.read()
+    except OSError:
+        return None
+
+
+def save_cached_search(kb_id: str, html: bytes) -> None:
+    """Store a catalog search page for a KB; cache write failures are ignored."""
+
+    path = search_cache_path(kb_id)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+
+    try:
+        with open(tmp_path, "wb") as handle:
+            handle.write(html)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
 
 
 def build_missing_list(scan_result: dict) -> List[MissingKbItem]:
@@ -135,9 +272,11 @@ def build_missing_list(scan_result: dict) -> List[MissingKbItem]:
     missing_kbs: List[str] = scan_result.get("MissingKbs") or []
     kb_entries: List[dict] = scan_result.get("KbEntries") or []
 
-    kb_index: Dict[str, dict] = {
-        str(e.get("KB")).upper(): e for e in kb_entries if e.get("KB")
-    }
+    kb_index: Dict[str, dict] = {}
+    for entry in kb_entries:
+        k = entry.get("KB")
+        if k:
+            kb_index[str(k).upper()] = entry
 
     out: List[MissingKbItem] = []
     for kb in missing_kbs:
@@ -145,44 +284,73 @@ def build_missing_list(scan_result: dict) -> List[MissingKbItem]:
         if not kb_id:
             continue
 
-        update_type = str(kb_index.get(kb_id, {}).get("UpdateType") or "Unknown")
+        update_type = str(kb_index.get(kb_id, _EMPTY_ENTRY).get("UpdateType") or "Unknown")
         out.append(MissingKbItem(kb_id=kb_id, update_type=update_type))
 
     return out
 
 
-def parse_search_candidates(html: str) -> List[CatalogCandidate]:
+def _keyword_mask(text: str) -> int:
+    """Encode the scoring keywords found in a case-folded title as a bitmask."""
+    mask = 0
+    for keyword in _KEYWORD_RE.findall(text):
+        mask |= _KEYWORD_BITS[keyword]
+    return mask
+
+
+def _html_parser() -> etree.HTMLParser:
+    """Return this thread's reusable HTML parser configured for a lean result tree."""
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = etree.HTMLParser(
+            remove_blank_text=True,
+            remove_comments=True,
+            remove_pis=True,
+            collect_ids=False,
+            no_network=True,
+            encoding="utf-8",
+        )
+        _parser_local.parser = parser
+    return parser
+
+
+def _cell_text(td: etree._Element) -> str:
+    """Join the stripped text fragments of a table cell with single spaces."""
+    return " ".join(t.strip() for t in td.itertext() if t.strip())
+
+
+def parse_search_candidates(html: bytes) -> List[CatalogCandidate]:
     """Parse Microsoft Update Catalog search results into structured candidates."""
 
-    soup = BeautifulSoup(html, "html.parser")
-    table = soup.find("table", id="ctl00_catalogBody_updateMatches")
-    if not table:
+    if not html:
+        return []
+
+    tree = etree.HTML(html, parser=_html_parser())
+    if tree is None:
         return []
 
     candidates: List[CatalogCandidate] = []
 
-    for tr in table.find_all("tr"):
+    for tr in _ROW_XPATH(tree, tid=RESULTS_TABLE_ID):
         tr_id = (tr.get("id") or "").strip()
-        if "_R" not in tr_id:
-            continue
 
         update_id = tr_id.split("_R", 1)[0]
-        if not re.fullmatch(r"[0-9a-fA-F-]{36}", update_id):
+        if not _UUID_RE.fullmatch(update_id):
             continue
 
-        tds = tr.find_all("td")
+        tds = _TD_XPATH(tr)
         if len(tds) < 8:
             continue
 
         candidates.append(
             CatalogCandidate(
                 update_id=update_id,
-                title=tds[1].get_text(" ", strip=True),
-                products=tds[2].get_text(" ", strip=True),
-                classification=tds[3].get_text(" ", strip=True),
-                last_updated=tds[4].get_text(" ", strip=True),
-                version=tds[5].get_text(" ", strip=True),
-                size=tds[6].get_text(" ", strip=True),
+                title=_cell_text(tds[1]),
+                products=_cell_text(tds[2]),
+                classification=_cell_text(tds[3]),
+                last_updated=_cell_text(tds[4]),
+                version=_cell_text(tds[5]),
+                size=_cell_text(tds[6]),
             )
         )
 
@@ -192,51 +360,39 @@ def parse_search_candidates(html: str) -> List[CatalogCandidate]:
 def score_candidate(candidate: CatalogCandidate, kb_id: str, c: BaselineConstraints) -> int:
     """Score a catalog candidate against baseline constraints."""
 
-    title = candidate.title.lower()
+    title = candidate.title_folded
     score = 0
 
-    if kb_id.lower() not in title:
+    if kb_id.casefold() not in title:
         return -10_000
     score += 50
 
-    if c.windows_gen:
-        if c.windows_gen in title:
-            score += 40
-        if c.windows_gen == "windows 10" and "windows 11" in title:
-            return -10_000
-        if c.windows_gen == "windows 11" and "windows 10" in title:
-            return -10_000
+    mask = candidate.keyword_mask
 
-    if c.windows_gen.startswith("windows") and "server" in title:
+    veto_bits, bonus_bits = _ARCH_RULES.get(c.catalog_arch, (0, 0))
+    if mask & veto_bits:
         return -10_000
 
-    if c.catalog_arch == "x64":
-        if any(x in title for x in ("arm64-based", "x86-based", "32-bit")):
+    gen_bits = _GEN_BITS.get(c.windows_gen)
+    if gen_bits:
+        match_bit, conflict_bit = gen_bits
+        if mask & (conflict_bit | _KW_SERVER):
             return -10_000
-        if "x64-based" in title:
-            score += 25
+        if mask & match_bit:
+            score += 40
 
-    elif c.catalog_arch == "arm64":
-        if any(x in title for x in ("x64-based", "x86-based", "32-bit")):
-            return -10_000
-        if "arm64-based" in title:
-            score += 25
+    if mask & bonus_bits:
+        score += 25
 
-    elif c.catalog_arch == "x86":
-        if any(x in title for x in ("x64-based", "arm64-based")):
-            return -10_000
-        if "x86-based" in title or "32-bit" in title:
-            score += 25
-
-    dv = c.display_version.lower()
+    dv = c.display_version
     if dv:
         if dv in title:
             score += 25
-        if re.search(r"\b\d{2}h[12]\b", title) and dv not in title:
+        if _HV_RE.search(title) and dv not in title:
             score -= 15
 
     if c.build_major:
-        m = re.search(r"\(\s*(\d{5})\.", title)
+        m = _BUILD_RE.search(title)
         if m:
             score += 10 if m.group(1) == c.build_major else -5
 
@@ -250,14 +406,16 @@ def choose_best_candidate(
 ) -> Tuple[Optional[CatalogCandidate], Optional[str]]:
     """Select the highest confidence candidate or return a reason for failure."""
 
-    scored = [(score_candidate(c, kb_id, constraints), c) for c in candidates]
-    scored = [(s, c) for s, c in scored if s >= 0]
+    best: Optional[CatalogCandidate] = None
+    best_score = -1
 
-    if not scored:
-        return None, "No candidate matched baseline constraints."
+    for candidate in candidates:
+        score = score_candidate(candidate, kb_id, constraints)
+        if score > best_score:
+            best, best_score = candidate, score
 
-    scored.sort(key=lambda x: x[0], reverse=True)
-    best_score, best = scored[0]
+    if best is None:
+        return None, "No candidate matched baseline constraints."
 
     if best_score < 90:
         return None, f"Ambiguous match below confidence threshold ({best_score})."
@@ -271,24 +429,30 @@ def build_dialog_params(update_id: str) -> dict:
     return {"updateIDs": payload}
 
 
-def extract_download_urls(html: str) -> List[str]:
-    """Extract direct .msu or .cab URLs from download dialog HTML."""
+def fetch_download_url(session: requests.Session, update_id: str) -> Optional[str]:
+    """Stream the download dialog and return the first .msu or .cab URL it contains."""
 
-    urls = re.findall(
-        r"https?://[^\"]+\.(?:msu|cab)(?:\?[^\"]*)?",
-        html,
-        flags=re.IGNORECASE,
-    )
+    params = build_dialog_params(update_id)
 
-    seen: set[str] = set()
-    out: List[str] = []
+    with session.get(DOWNLOAD_DIALOG_URL, params=params, stream=True, timeout=DEFAULT_TIMEOUT) as r:
+        r.raise_for_status()
+        decoder = codecs.getincrementaldecoder(r.encoding or "utf-8")(errors="ignore")
 
-    for u in urls:
-        if u not in seen:
-            seen.add(u)
-            out.append(u)
+        window = ""
+        received = 0
 
-    return out
+        for chunk in r.iter_content(chunk_size=DIALOG_CHUNK_SIZE):
+            received += len(chunk)
+            window = window[-DIALOG_SCAN_OVERLAP:] + decoder.decode(chunk)
+
+            m = _DOWNLOAD_URL_RE.search(window)
+            if m:
+                return (m.group(1) or m.group(2)).strip()
+
+            if received >= DIALOG_MAX_BYTES:
+                break
+
+    return None
 
 
 def download_file(session: requests.Session, url: str, out_dir: str) -> str:
@@ -299,14 +463,69 @@ def download_file(session: requests.Session, url: str, out_dir: str) -> str:
 
     with session.get(url, stream=True, timeout=DEFAULT_TIMEOUT) as r:
         r.raise_for_status()
+        r.raw.decode_content = True
         with open(out_path, "wb") as h:
-            for chunk in r.iter_content(chunk_size=1024 * 256):
-                if chunk:
-                    h.write(chunk)
+            shutil.copyfileobj(r.raw, h, length=DOWNLOAD_CHUNK_SIZE)
 
     return out_path
 
 
+def parse_selection(raw: str, count: int) -> Tuple[List[int], Optional[str]]:
+    """Parse a comma-separated list of 1-based menu indices or return a reason for failure."""
+
+    indices: List[int] = []
+
+    for part in raw.split(","):
+        part = part.strip()
+        if not part.isdigit():
+            return [], "Invalid selection"
+
+        idx = int(part)
+        if idx < 1 or idx > count:
+            return [], "Selection out of range"
+
+        if idx not in indices:
+            indices.append(idx)
+
+    return indices, None
+
+
+def resolve_and_download(
+    session: requests.Session,
+    kb_id: str,
+    constraints: BaselineConstraints,
+) -> DownloadOutcome:
+    """Resolve a KB to its best catalog package and download it."""
+
+    print(f"[*] Searching catalog for {kb_id}")
+
+    try:
+        html = load_cached_search(kb_id)
+        cached = html is not None
+        if not cached:
+            html = fetch_html(session, SEARCH_URL, params={"q": kb_id})
+
+        candidates = parse_search_candidates(html)
+        if candidates and not cached:
+            save_cached_search(kb_id, html)
+
+        best, reason = choose_best_candidate(candidates, kb_id, constraints)
+        if not best:
+            return DownloadOutcome(kb_id=kb_id, error=reason)
+
+        print(f"[+] Selected: {best.title}")
+
+        url = fetch_download_url(session, best.update_id)
+        if not url:
+            return DownloadOutcome(kb_id=kb_id, error="No download URL found")
+
+        out_path = download_file(session, url, DOWNLOADS_DIR)
+    except Exception as exc:
+        return DownloadOutcome(kb_id=kb_id, error=f"Download failed: {exc}")
+
+    return DownloadOutcome(kb_id=kb_id, out_path=out_path)
+
+
 def main() -> int:
     print("[*] Running WinShield downloader")
 
@@ -323,41 +542,31 @@ def main() -> int:
         print(f"{i}) {item.kb_id} [{item.update_type}]")
     print()
 
-    raw = safe_input("Select KB: ").strip()
-    if not raw.isdigit():
-        print("[!] Invalid selection")
-        return 1
-
-    idx = int(raw)
-    if idx < 1 or idx > len(missing_items):
-        print("[!] Selection out of range")
-        return 1
-
-    kb_id = missing_items[idx - 1].kb_id
-    session = build_session()
-
-    print(f"[*] Searching catalog for {kb_id}")
-    html = fetch_text(session, SEARCH_URL, params={"q": kb_id})
-
-    candidates = parse_search_candidates(html)
-    best, reason = choose_best_candidate(candidates, kb_id, constraints)
-
-    if not best:
+    raw = safe_input("Select KB(s), comma-separated: ").strip()
+    indices, reason = parse_selection(raw, len(missing_items))
+    if reason:
         print(f"[!] {reason}")
         return 1
 
-    print(f"[+] Selected: {best.title}")
-    dialog_html = fetch_text(session, DOWNLOAD_DIALOG_URL, params=build_dialog_params(best.update_id))
-    urls = extract_download_urls(dialog_html)
-
-    if not urls:
-        print("[!] No download URL found")
-        return 1
-
-    out_path = download_file(session, urls[0], DOWNLOADS_DIR)
-    print(f"[+] Downloaded to {out_path}")
+    kb_ids = [missing_items[i - 1].kb_id for i in indices]
+    session = build_session()
 
-    return 0
+    rc = 0
+    workers = min(MAX_DOWNLOAD_WORKERS, len(kb_ids))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(resolve_and_download, session, kb_id, constraints) for kb_id in kb_ids
+        ]
+
+        for future in as_completed(futures):
+            outcome = future.result()
+            if outcome.error:
+                print(f"[!] {outcome.kb_id}: {outcome.error}")
+                rc = 1
+                continue
+            print(f"[+] Downloaded to {outcome.out_path}")
+
+    return rc
 
 
 if __name__ == "__main__":
@@ -5,18 +5,34 @@ Core engine that correlates installed Windows updates with MSRC CVRF data.
 Executes PowerShell collectors, resolves expected KBs, and determines patch posture.
 """
 
+import argparse
+import atexit
+import base64
+import hashlib
 import json
 import os
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 BASELINE_SCRIPT = "winshield_baseline.ps1"
 INVENTORY_SCRIPT = "winshield_inventory.ps1"
 ADAPTER_SCRIPT = "winshield_adapter.ps1"
 
+MSRC_OPEN_MONTH_TTL = 6 * 3600
+TABLE_MAX_ENTRIES = 500
+
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 ROOT_DIR = os.path.dirname(SCRIPT_DIR)
@@ -24,41 +40,287 @@ ROOT_DIR = os.path.dirname(SCRIPT_DIR)
 RESULTS_DIR = os.path.join(ROOT_DIR, "results")
 DOWNLOADS_DIR = os.path.join(ROOT_DIR, "downloads")
 
+MSRC_CACHE_DIR = os.path.join(RESULTS_DIR, "msrc_cache")
+
 SCAN_RESULT_PATH = os.path.join(RESULTS_DIR, "winshield_scan_result.json")
 
 os.makedirs(RESULTS_DIR, exist_ok=True)
 os.makedirs(DOWNLOADS_DIR, exist_ok=True)
+os.makedirs(MSRC_CACHE_DIR, exist_ok=True)
+
+
+POWERSHELL_HOST_PREFIX = "@@WINSHIELD@@ "
+
+POWERSHELL_HOST_LOOP = r"""
+[Console]::InputEncoding = New-Object System.Text.UTF8Encoding $false
+[Console]::OutputEncoding = New-Object System.Text.UTF8Encoding $false
+
+while ($null -ne ($line = [Console]::In.ReadLine())) {
+    $code = 0
+    $output = ''
+
+    try {
+        $req = $line | ConvertFrom-Json
+        $params = @{}
+        foreach ($p in $req.Params.PSObject.Properties) { $params[$p.Name] = $p.Value }
+
+        $global:LASTEXITCODE = 0
+        $output = @(& $req.Script @params) -join "`n"
+        $code = $global:LASTEXITCODE
+    } catch {
+        $code = 1
+        $output = $_.Exception.Message
+    }
+
+    $reply = [pscustomobject]@{ ExitCode = $code; Output = $output } | ConvertTo-Json -Compress
+    [Console]::Out.WriteLine()
+    [Console]::Out.WriteLine('%PREFIX%' + $reply)
+    [Console]::Out.Flush()
+}
+""".replace("%PREFIX%", POWERSHELL_HOST_PREFIX.replace("'", "''"))
+
+
+class PowerShellHost:
+    """Long-lived PowerShell process that runs collector scripts on request.
+
+    Requests and replies are single JSON lines over stdin/stdout, so the
+    PowerShell startup and module loading cost is paid once per host.
+    """
+
+    def __init__(self) -> None:
+        encoded = base64.b64encode(POWERSHELL_HOST_LOOP.encode("utf-16-le")).decode("ascii")
+
+        self._proc = subprocess.Popen(
+            [
+                "powershell.exe",
+                "-NoProfile",
+                "-NoLogo",
+                "-NonInteractive",
+                "-ExecutionPolicy", "Bypass",
+                "-EncodedCommand", encoded,
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+        )
+
+    def invoke(self, script_path: str, params: Dict[str, object]) -> Tuple[int, str]:
+        """Run a script with named parameters and return its exit code and output."""
+
+        request = json.dumps({"Script": script_path, "Params": params})
+
+        try:
+            self._proc.stdin.write(request + "\n")
+            self._proc.stdin.flush()
+        except OSError as exc:
+            raise RuntimeError("PowerShell host is not accepting requests") from exc
+
+        for line in self._proc.stdout:
+            start = line.find(POWERSHELL_HOST_PREFIX)
+            if start >= 0:
+                reply = json.loads(line[start + len(POWERSHELL_HOST_PREFIX):])
+                return int(reply.get("ExitCode") or 0), str(reply.get("Output") or "")
+
+        raise RuntimeError("PowerShell host exited unexpectedly")
+
+    def close(self) -> None:
+        """Stop the host process."""
+
+        if self._proc.poll() is not None:
+            return
+
+        try:
+            self._proc.stdin.close()
+            self._proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self._proc.kill()
+
+
+_idle_hosts: List[PowerShellHost] = []
+_hosts_lock = threading.Lock()
+
+
+def _acquire_host() -> PowerShellHost:
+    with _hosts_lock:
+        if _idle_hosts:
+            return _idle_hosts.pop()
+    return PowerShellHost()
+
+
+def _release_host(host: PowerShellHost) -> None:
+    with _hosts_lock:
+        _idle_hosts.append(host)
+
+
+def close_powershell_hosts() -> None:
+    """Stop every idle PowerShell host."""
+
+    with _hosts_lock:
+        hosts = list(_idle_hosts)
+        _idle_hosts.clear()
+
+    for host in hosts:
+        host.close()
+
+
+atexit.register(close_powershell_hosts)
+
+
+def args_to_params(args: List[str]) -> Dict[str, object]:
+    """Convert a -Name value argument list into named script parameters."""
+
+    params: Dict[str, object] = {}
+    i = 0
+
+    while i < len(args):
+        name = args[i].lstrip("-")
+        if i + 1 < len(args) and not args[i + 1].startswith("-"):
+            params[name] = args[i + 1]
+            i += 2
+        else:
+            params[name] = True
+            i += 1
+
+    return params
 
 
 def run_powershell_script(script_name: str, extra_args: List[str] | None = None) -> dict:
-    """Execute a PowerShell script and parse its JSON output."""
+    """Execute a PowerShell script on a pooled host and parse its JSON output."""
 
-    args = extra_args or []
+    params = args_to_params(extra_args or [])
     script_path = os.path.join(SCRIPT_DIR, script_name)
 
-    cmd = [
-        "powershell.exe",
-        "-NoProfile",
-        "-ExecutionPolicy", "Bypass",
-        "-File", script_path,
-        *args,
-    ]
-
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    host = _acquire_host()
+    try:
+        returncode, stdout = host.invoke(script_path, params)
+    except Exception:
+        host.close()
+        raise
+    _release_host(host)
 
-    if result.returncode != 0:
+    if returncode != 0:
         raise RuntimeError(f"{script_name} execution failed")
 
-    stdout = result.stdout.strip()
+    stdout = stdout.strip()
     if not stdout:
         raise RuntimeError(f"{script_name} returned no output")
 
     try:
-        return json.loads(stdout)
+        return orjson.loads(stdout) if orjson else json.loads(stdout)
     except json.JSONDecodeError as exc:
         raise RuntimeError(f"{script_name} returned invalid JSON") from exc
 
 
+def run_adapter(month_ids: List[str], product_name_hint: str) -> dict:
+    """Query MSRC CVRF data for a set of MonthIds through the adapter script."""
+    return run_powershell_script(
+        ADAPTER_SCRIPT,
+        extra_args=[
+            "-MonthIds", ",".join(month_ids),
+            "-ProductNameHint", product_name_hint,
+        ],
+    )
+
+
+@dataclass
+class ScanContext:
+    baseline: dict
+    installed_kbs: Set[str]
+    month_ids: List[str]
+    kb_map: Dict[str, dict]
+    kb_entries: List[dict] = field(default_factory=list)
+    logical_present: Set[str] = field(default_factory=set)
+    superseded_by: Dict[str, List[str]] = field(default_factory=dict)
+    missing: List[str] = field(default_factory=list)
+
+
+def msrc_cache_path(month_id: str, product_name_hint: str) -> str:
+    """Return the cache file path for one MonthId and product."""
+    key = hashlib.sha1(f"{month_id}|{product_name_hint}".encode("utf-8")).hexdigest()
+    return os.path.join(MSRC_CACHE_DIR, f"{key}.json")
+
+
+def load_cached_month(month_id: str, product_name_hint: str) -> Optional[List[dict]]:
+    """Return cached adapter entries for a month, or None when absent or expired.
+
+    Entries saved while the month was still open expire after
+    MSRC_OPEN_MONTH_TTL; entries saved after it closed never expire.
+    """
+
+    path = msrc_cache_path(month_id, product_name_hint)
+
+    try:
+        with open(path, "rb") as handle:
+            raw = handle.read()
+        cached = orjson.loads(raw) if orjson else json.loads(raw)
+
+        if not isinstance(cached, dict) or not isinstance(cached.get("Entries"), list):
+            return None
+        if cached.get("Open", True) and time.time() - os.path.getmtime(path) > MSRC_OPEN_MONTH_TTL:
+            return None
+        return cached["Entries"]
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached_month(
+    month_id: str, product_name_hint: str, entries: List[dict], is_open: bool
+) -> None:
+    """Store adapter entries for a month; cache write failures are ignored."""
+
+    path = msrc_cache_path(month_id, product_name_hint)
+    tmp_path = f"{path}.tmp"
+
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump({"Open": is_open, "Entries": entries}, handle)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def fetch_msrc_entries(
+    month_ids: List[str], product_name_hint: str, use_cache: bool = True
+) -> Tuple[List[dict], int]:
+    """Collect adapter entries for MonthIds, querying MSRC only for uncached months.
+
+    A month fetched while it is the most recent one may still be revised, so it
+    is cached as open and refetched after MSRC_OPEN_MONTH_TTL; a month fetched
+    once a later month exists is cached indefinitely.
+    Returns the entries and the number of months served from cache.
+    """
+
+    entries: List[dict] = []
+    uncached: List[str] = []
+
+    for month_id in month_ids:
+        cached = load_cached_month(month_id, product_name_hint) if use_cache else None
+        if cached is None:
+            uncached.append(month_id)
+        else:
+            entries.extend(cached)
+
+    if not uncached:
+        return entries, len(month_ids)
+
+    fresh = run_adapter(uncached, product_name_hint).get("KbEntries") or []
+    entries.extend(fresh)
+
+    if use_cache:
+        by_month: Dict[str, List[dict]] = {}
+        for entry in fresh:
+            for month_id in entry.get("Months") or []:
+                by_month.setdefault(month_id, []).append(entry)
+
+        for month_id, month_entries in by_month.items():
+            is_open = month_id == month_ids[-1]
+            save_cached_month(month_id, product_name_hint, month_entries, is_open)
+
+    return entries, len(month_ids) - len(uncached)
+
+
 def build_month_ids_from_lcu(baseline: dict, max_months: int = 48) -> List[str]:
     """Build a MonthId range from installed LCU up to the latest MSRC month."""
 
@@ -101,12 +363,8 @@ def build_month_ids_from_lcu(baseline: dict, max_months: int = 48) -> List[str]:
     return month_ids
 
 
-def chunk_list(items: List[str], size: int) -> List[List[str]]:
-    return [items[i:i + size] for i in range(0, len(items), size)]
-
-
 def merge_kb_entries(existing: Dict[str, dict], incoming: List[dict]) -> None:
-    """Merge adapter KB entries into an indexed structure."""
+    """Merge adapter KB entries into an indexed structure of de-duplicated field sets."""
 
     for entry in incoming:
         kb_id = entry.get("KB")
@@ -115,13 +373,30 @@ def merge_kb_entries(existing: Dict[str, dict], incoming: List[dict]) -> None:
 
         target = existing.setdefault(
             kb_id,
-            {"KB": kb_id, "Months": [], "Cves": [], "Supersedes": []},
+            {"KB": kb_id, "Months": set(), "Cves": set(), "Supersedes": set()},
         )
 
-        for field in ("Months", "Cves", "Supersedes"):
-            for value in entry.get(field) or []:
-                if value and value not in target[field]:
-                    target[field].append(value)
+        for key in ("Months", "Cves", "Supersedes"):
+            target[key].update(value for value in entry.get(key) or () if value)
+
+
+def normalize_kb_entries(kb_map: Dict[str, dict]) -> List[dict]:
+    """Convert merged field sets into sorted lists and classify each KB.
+
+    After normalisation every entry carries list-valued Months, Cves and
+    Supersedes plus UpdateType and CveCount, so consumers can index them directly.
+    """
+
+    kb_entries = list(kb_map.values())
+
+    for e in kb_entries:
+        e["Months"] = sorted(e["Months"])
+        e["Cves"] = sorted(e["Cves"])
+        e["Supersedes"] = sorted(e["Supersedes"])
+        e["UpdateType"] = "Superseding" if e["Supersedes"] else "Standalone"
+        e["CveCount"] = len(e["Cves"])
+
+    return kb_entries
 
 
 def compute_supersedence(
@@ -132,14 +407,17 @@ def compute_supersedence(
     supersedes_map: Dict[str, Set[str]] = {}
 
     for entry in kb_entries:
-        kb_id = entry.get("KB")
-        for old in entry.get("Supersedes") or []:
-            supersedes_map.setdefault(kb_id, set()).add(old)
+        for old in entry["Supersedes"]:
+            supersedes_map.setdefault(entry["KB"], set()).add(old)
 
     logical_present = set(installed_kbs)
     superseded_by: Dict[str, Set[str]] = {}
 
-    for root in installed_kbs:
+    roots = installed_kbs & supersedes_map.keys()
+    if not roots:
+        return logical_present, {}
+
+    for root in roots:
         stack = [root]
         seen = {root}
 
@@ -164,28 +442,27 @@ def print_kb_table(
 
 
 
-    kb_index: Dict[str, dict] = {}
-    for entry in kb_entries:
-        if entry.get("KB"):
-            kb_index[entry["KB"]] = entry
+    kb_index: Dict[str, dict] = {entry["KB"]: entry for entry in kb_entries}
 
 
-    all_kbs = sorted(set(kb_index.keys()) | set(installed_kbs) | set(logical_present_kbs))
+    all_kbs = sorted(kb_index.keys() | installed_kbs | logical_present_kbs)
 
     col_kb_width = 11
     col_type_width = 12
     col_status_width = 40
     col_months_width = 20
 
-    print("=== Correlation ===")
-    print(
+    separator = "-" * 110
+
+    lines: List[str] = [
+        "=== Correlation ===",
         f"{'KB':<{col_kb_width}} "
         f"{'Type':<{col_type_width}} "
         f"{'Status':<{col_status_width}} "
         f"{'Months':<{col_months_width}} "
-        f"CVEs"
-    )
-    print("-" * 110)
+        f"CVEs",
+        separator,
+    ]
 
     for kb_id in all_kbs:
         entry = kb_index.get(kb_id)
@@ -198,9 +475,9 @@ def print_kb_table(
                 "UpdateType": "Unmapped",
             }
 
-        months = list(entry.get("Months") or [])
-        cves = list(entry.get("Cves") or [])
-        update_type = entry.get("UpdateType", "")
+        months = entry["Months"] or [""]
+        cves = entry["Cves"] or [""]
+        update_type = entry["UpdateType"]
 
         if kb_id in installed_kbs:
             status = "Installed"
@@ -210,11 +487,6 @@ def print_kb_table(
         else:
             status = "Missing"
 
-        if not months:
-            months = [""]
-        if not cves:
-            cves = [""]
-
         height = max(len(months), len(cves))
 
         for i in range(height):
@@ -224,7 +496,7 @@ def print_kb_table(
             month_cell = months[i] if i < len(months) else ""
             cve_cell = cves[i] if i < len(cves) else ""
 
-            print(
+            lines.append(
                 f"{kb_cell:<{col_kb_width}} "
                 f"{type_cell:<{col_type_width}} "
                 f"{status_cell:<{col_status_width}} "
@@ -232,25 +504,98 @@ def print_kb_table(
                 f"{cve_cell}"
             )
 
-        print("-" * 110)
+        lines.append(separator)
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="WinShield scanner")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="query MSRC for every month and leave the month cache untouched",
+    )
+    table = parser.add_mutually_exclusive_group()
+    table.add_argument(
+        "--quiet",
+        action="store_true",
+        help="skip the per-KB correlation table",
+    )
+    table.add_argument(
+        "--table",
+        action="store_true",
+        help="always print the correlation table, even when piped or over %d KBs"
+        % TABLE_MAX_ENTRIES,
+    )
+    parser.add_argument(
+        "--out",
+        default=SCAN_RESULT_PATH,
+        help="path of the scan result JSON (default: %(default)s)",
+    )
+    return parser.parse_args(argv)
+
+
+def collect_host_state() -> Tuple[dict, dict]:
+    """Run the baseline and inventory collectors concurrently."""
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        baseline_future = executor.submit(run_powershell_script, BASELINE_SCRIPT)
+        inventory_future = executor.submit(run_powershell_script, INVENTORY_SCRIPT)
+        return baseline_future.result(), inventory_future.result()
+
+
+def classify(ctx: ScanContext) -> ScanContext:
+    """Normalise merged KB data and resolve installed, superseded and missing KBs."""
 
+    ctx.kb_entries = normalize_kb_entries(ctx.kb_map)
+    ctx.logical_present, ctx.superseded_by = compute_supersedence(ctx.kb_entries, ctx.installed_kbs)
+    ctx.missing = sorted(ctx.kb_map.keys() - ctx.logical_present)
+    return ctx
 
-def main() -> None:
-    print("[*] Collecting baseline...")
-    baseline = run_powershell_script(BASELINE_SCRIPT)
+
+def build_scan_result(ctx: ScanContext) -> dict:
+    """Assemble the scan result document written for the downloader."""
+
+    months_with_entries = {m for e in ctx.kb_map.values() for m in e["Months"]}
+
+    return {
+        "Baseline": ctx.baseline,
+        "InstalledKbs": sorted(ctx.installed_kbs),
+        "MonthsRequested": ctx.month_ids,
+        "MonthsWithEntries": sorted(months_with_entries),
+        "KbEntries": [ctx.kb_map[kb] for kb in sorted(ctx.kb_map)],
+        "MissingKbs": ctx.missing,
+    }
+
+
+def write_scan_result(result: dict, path: str) -> None:
+    """Write the scan result as indented JSON."""
+
+    if orjson:
+        with open(path, "wb") as h:
+            h.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as h:
+            json.dump(result, h, indent=2)
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    print("[*] Collecting baseline and inventory...")
+    baseline, inventory = collect_host_state()
 
     product_name_hint = baseline.get("ProductNameHint")
     if not product_name_hint:
         print("[!] Failed to resolve ProductNameHint")
-        sys.exit(1)
+        return 1
+
+    installed_kbs = set(inventory.get("AllInstalledKbs") or [])
 
     print(f"[+] {baseline.get('OsName')} {baseline.get('DisplayVersion')} ({baseline.get('Build')})")
     print(f"[+] Product: {product_name_hint}")
-    print()
-
-    print("[*] Collecting inventory...")
-    inventory = run_powershell_script(INVENTORY_SCRIPT)
-    installed_kbs = set(inventory.get("AllInstalledKbs") or [])
     print(f"[+] Installed KBs: {len(installed_kbs)}")
     print()
 
@@ -259,79 +604,71 @@ def main() -> None:
     print(f"[+] Months: {', '.join(month_ids)}")
     print()
 
-    merged: Dict[str, dict] = {}
-    months_with_entries: List[str] = []
-
     print("[*] Querying MSRC...")
-    for chunk in chunk_list(month_ids, 3):
-        msrc_data = run_powershell_script(
-            ADAPTER_SCRIPT,
-            extra_args=[
-                "-MonthIds", ",".join(chunk),
-                "-ProductNameHint", product_name_hint,
-            ],
-        )
+    msrc_entries, cached_months = fetch_msrc_entries(
+        month_ids, product_name_hint, use_cache=not args.no_cache
+    )
+    if cached_months:
+        print(f"[+] Months served from cache: {cached_months}/{len(month_ids)}")
 
-        entries = msrc_data.get("KbEntries") or []
-        if entries:
-            months_with_entries.extend(chunk)
-            merge_kb_entries(merged, entries)
+    kb_map: Dict[str, dict] = {}
+    merge_kb_entries(kb_map, msrc_entries)
 
-    if not merged:
+    if not kb_map:
         print("[!] No KB data returned")
-        sys.exit(0)
-
-    kb_entries = list(merged.values())
-
-    for e in kb_entries:
-        e["Months"] = sorted(set(e.get("Months") or []))
-        e["Cves"] = sorted(set(e.get("Cves") or []))
-        e["Supersedes"] = sorted(set(e.get("Supersedes") or []))
-        e["UpdateType"] = "Superseding" if e["Supersedes"] else "Standalone"
-
-    logical_present, superseded_by = compute_supersedence(kb_entries, installed_kbs)
-
-    expected = {e["KB"] for e in kb_entries}
-    missing = sorted(expected - logical_present)
+        return 0
+
+    ctx = classify(
+        ScanContext(
+            baseline=baseline,
+            installed_kbs=installed_kbs,
+            month_ids=month_ids,
+            kb_map=kb_map,
+        )
+    )
 
     print()
     print("=== Summary ===")
-    print(f"Expected KBs: {len(expected)}")
-    print(f"Missing KBs:  {len(missing)}")
+    print(f"Expected KBs: {len(ctx.kb_map)}")
+    print(f"Missing KBs:  {len(ctx.missing)}")
     print()
 
-    print_kb_table(
-        kb_entries=kb_entries,
-        installed_kbs=installed_kbs,
-        logical_present_kbs=logical_present,
-        superseded_by=superseded_by,
-    )
+    if args.quiet:
+        pass
+    elif not args.table and not sys.stdout.isatty():
+        print("[*] Correlation table skipped (output is not a terminal; use --table)")
+    elif not args.table and len(ctx.kb_entries) > TABLE_MAX_ENTRIES:
+        print(
+            f"[*] Correlation table skipped ({len(ctx.kb_entries)} KBs, "
+            f"limit {TABLE_MAX_ENTRIES}; use --table)"
+        )
+    else:
+        print_kb_table(
+            kb_entries=ctx.kb_entries,
+            installed_kbs=ctx.installed_kbs,
+            logical_present_kbs=ctx.logical_present,
+            superseded_by=ctx.superseded_by,
+        )
 
     print()
     print("=== Missing ===")
-    if not missing:
+    if not ctx.missing:
         print("None")
     else:
-        for kb in missing:
-            entry = next((e for e in kb_entries if e.get("KB") == kb), {})
-            months = ", ".join(entry.get("Months") or [])
-            cve_count = len(entry.get("Cves") or [])
-            print(f"- {kb} | Months: {months}, CVEs: {cve_count}")
-
-    result = {
-        "Baseline": baseline,
-        "InstalledKbs": sorted(installed_kbs),
-        "MonthsRequested": month_ids,
-        "MonthsWithEntries": sorted(set(months_with_entries)),
-        "KbEntries": sorted(kb_entries, key=lambda x: x["KB"]),
-        "MissingKbs": missing,
-    }
+        lines = []
+        for kb in ctx.missing:
+            entry = ctx.kb_map[kb]
+            months = ", ".join(entry["Months"])
+            lines.append(f"- {kb} | Months: {months}, CVEs: {entry['CveCount']}")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
-    with open(SCAN_RESULT_PATH, "w", encoding="utf-8") as h:
-        json.dump(result, h, indent=2)
+    write_scan_result(build_scan_result(ctx), args.out)
 
     print()
-    print(f"[+] Saved scan result to {SCAN_RESULT_PATH}")
+    print(f"[+] Saved scan result to {args.out}")
+
+    return 0
 
 
 if __name__ == "__main__":